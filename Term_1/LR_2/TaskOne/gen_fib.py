@@ -1,12 +1,115 @@
 import functools
-from typing import Generator, List, Any
+import sys
+from array import array
+from itertools import chain
+from typing import Dict, Generator, List, Any, Optional
+
+# наибольшее значение, помещающееся в машинное слово (int64, тип 'q')
+WORD_MAX = 2 ** 63 - 1
+# лимит памяти кэша по умолчанию — 32 МиБ
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+class FibCache:
+    """Растущий кэш уже посчитанных элементов ряда Фибоначчи.
+
+    Пока числа помещаются в машинное слово, они хранятся компактно
+    в array('q'), после этого — в обычном списке больших int.
+    Объём кэша ограничен max_bytes: элементы сверх лимита
+    досчитываются на лету, но не запоминаются.
+    """
+
+    def __init__(self, max_bytes: Optional[int] = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.clear()
+
+    def clear(self) -> None:
+        """Сбросить кэш и статистику"""
+        self._small = array("q", [0, 1])
+        self._big: List[int] = []
+        self._big_bytes = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._small) + len(self._big)
+
+    def __iter__(self):
+        return chain(self._small, self._big)
+
+    def __getitem__(self, idx: int) -> int:
+        if idx < 0:
+            idx += len(self)
+        if idx < len(self._small):
+            return self._small[idx]
+        return self._big[idx - len(self._small)]
+
+    @property
+    def nbytes(self) -> int:
+        """Примерный объём памяти, занятый элементами кэша"""
+        return len(self._small) * self._small.itemsize + self._big_bytes
+
+    def _append(self, value: int) -> bool:
+        """Добавить следующий элемент, если позволяет лимит памяти"""
+        fits_word = value <= WORD_MAX and not self._big
+        size = self._small.itemsize if fits_word else sys.getsizeof(value)
+        if self.max_bytes is not None and self.nbytes + size > self.max_bytes:
+            return False
+        if fits_word:
+            self._small.append(value)
+        else:
+            self._big.append(value)
+            self._big_bytes += size
+        return True
+
+    def prefix(self, n: int) -> List[int]:
+        """Вернуть первые n элементов ряда, при необходимости дополнив кэш"""
+        if n <= len(self):
+            self.hits += 1
+        else:
+            self.misses += 1
+            a, b = self[-2], self[-1]
+            cached = True
+            while len(self) < n and cached:
+                a, b = b, a + b
+                cached = self._append(b)
+            if not cached:
+                # лимит исчерпан: хвост считаем без сохранения в кэш
+                tail = [b]
+                while len(self) + len(tail) < n:
+                    a, b = b, a + b
+                    tail.append(b)
+                return self._small.tolist() + self._big + tail
+
+        res = self._small[:n].tolist()
+        if n > len(self._small):
+            res.extend(self._big[:n - len(self._small)])
+        return res
+
+    def stats(self) -> Dict[str, int]:
+        """Статистика попаданий/промахов и размер кэша"""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self),
+            "nbytes": self.nbytes,
+        }
+
+
+# общий кэш для fib_elem_gen и my_genn
+fib_cache = FibCache()
+
 
 def fib_elem_gen() -> Generator[int, None, None]:
     """Генератор, возвращающий элементы ряда Фибоначчи"""
-    a, b = 0, 1
+    # уже посчитанное берём из общего кэша, дальше считаем без учёта в нём
+    a, b = 1, 0
+    for value in fib_cache:
+        yield value
+        a, b = b, value
     while True:
-        yield a
         a, b = b, a + b
+        yield b
 
 def my_genn() -> Generator[Any, int, List[Any]]:
     """Сопрограмма для генерации ряда Фибоначчи"""
@@ -33,10 +136,7 @@ def my_genn() -> Generator[Any, int, List[Any]]:
             continue
 
         l = [header]
-        a, b = 0, 1
-        for _ in range(number_of_fib_elem):
-            l.append(a)
-            a, b = b, a + b
+        l.extend(fib_cache.prefix(number_of_fib_elem))
 
         # вернём готовый список
         yield l
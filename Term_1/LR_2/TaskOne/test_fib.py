@@ -1,16 +1,15 @@
-import io
-import sys
-import pytest
+import functools
 import runpy
 import os
 
-# путь до файла
-MODULE_PATH = "/Users/aleksandr/Downloads/Term_programming/LR_2/TaskOne/gen_fib.py"
+# путь до файла рядом с тестом
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "gen_fib.py")
 
+
+@functools.lru_cache(maxsize=None)
 def load_module():
-    """Запускаем модуль и возвращаем его namespace"""
-    ns = runpy.run_path(MODULE_PATH, run_name="__main__")
-    return ns
+    """Загружаем модуль один раз и возвращаем его namespace"""
+    return runpy.run_path(MODULE_PATH)
 
 
 def test_fib_elem_gen_sequence():
@@ -78,3 +77,74 @@ def test_fib_coroutine_primes_generator():
     gen = my_genn()
     result = gen.send(2)
     assert result == ["2:", 0, 1]
+
+
+def test_fib_cache_matches_plain_sequence():
+    ns = load_module()
+    FibCache = ns["FibCache"]
+
+    expected = []
+    a, b = 0, 1
+    for _ in range(200):
+        expected.append(a)
+        a, b = b, a + b
+
+    cache = FibCache()
+    # 200 элементов — переходим границу машинного слова (F(93))
+    assert cache.prefix(200) == expected
+    assert cache.prefix(10) == expected[:10]
+    assert cache.prefix(150) == expected[:150]
+
+
+def test_fib_cache_hits_and_misses():
+    ns = load_module()
+    FibCache = ns["FibCache"]
+
+    cache = FibCache()
+    cache.prefix(10)
+    cache.prefix(5)
+    cache.prefix(20)
+    stats = cache.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["size"] == 20
+
+
+def test_fib_cache_respects_memory_limit():
+    ns = load_module()
+    FibCache = ns["FibCache"]
+
+    cache = FibCache(max_bytes=8 * 50)
+    result = cache.prefix(300)
+    assert len(result) == 300
+    assert result[-1] == result[-2] + result[-3]
+    assert len(cache) == 50
+    assert cache.nbytes <= 8 * 50
+
+
+def test_my_genn_uses_shared_cache():
+    ns = load_module()
+    my_genn = ns["my_genn"]
+    fib_cache = ns["fib_cache"]
+
+    gen = my_genn()
+    gen.send(30)
+    next(gen)
+    result = gen.send(10)
+    assert result == ["10:", 0, 1, 1, 2, 3, 5, 8, 13, 21, 34]
+    assert fib_cache.stats()["hits"] >= 1
+
+
+def test_fib_elem_gen_continues_after_cache():
+    ns = load_module()
+    FibCache = ns["FibCache"]
+    fib_elem_gen = ns["fib_elem_gen"]
+    fib_cache = ns["fib_cache"]
+
+    fib_cache.clear()
+    fib_cache.prefix(20)
+    g = fib_elem_gen()
+    seq = [next(g) for _ in range(200)]
+    assert seq == FibCache(max_bytes=None).prefix(200)
+    # обычный обход не раздувает общий кэш
+    assert len(fib_cache) == 20
@@ -1,11 +1,26 @@
+from itertools import islice
+
+try:
+    import numpy as np
+except ImportError:  # numpy необязателен — без него работает обычный путь
+    np = None
+
+
 class FibonacchiLst:
-    def __init__(self, instance):
-        self.instance = instance   # сохраняем исходный список
-        self.idx = 0               # текущий индекс при обходе
-        # заранее построим множество чисел Фибоначчи до max(instance),
-        # чтобы проверка принадлежности была быстрой (O(1))
-        max_val = max(instance) if instance else 0
-        self.fib_set = self._fib_up_to(max_val)
+    # сколько элементов обрабатываем за один проход
+    CHUNK_SIZE = 4096
+
+    def __init__(self, instance, chunk_size=CHUNK_SIZE):
+        if chunk_size < 1:
+            raise ValueError("chunk_size должен быть не меньше 1")
+        self.instance = instance   # исходные данные: список, генератор, файл, массив
+        self.chunk_size = chunk_size
+        # множество чисел Фибоначчи растёт по мере появления больших значений,
+        # поэтому max(instance) заранее не нужен и вход можно читать потоком
+        self.fib_set = {0, 1}
+        self._a, self._b = 0, 1    # два последних построенных числа
+        self._chunks = self.chunks()
+        self._buf = iter(())
 
     def __iter__(self):
         return self
@@ -13,26 +28,53 @@ class FibonacchiLst:
     def __next__(self):
         while True:
             try:
-                res = self.instance[self.idx]
-            except IndexError:
-                raise StopIteration
+                return next(self._buf)
+            except StopIteration:
+                pass
+            # StopIteration из self._chunks означает, что данные закончились
+            self._buf = iter(next(self._chunks))
+
+    def chunks(self):
+        """Генератор списков подходящих элементов, по одному на каждый блок входа"""
+        if self._is_int_array(self.instance):
+            yield from self._array_chunks(self.instance)
+            return
 
-            self.idx += 1
+        it = iter(self.instance)
+        while True:
+            chunk = list(islice(it, self.chunk_size))
+            if not chunk:
+                return
+            self.grow(max(chunk))
+            yield list(filter(self.fib_set.__contains__, chunk))
 
-            if res in self.fib_set:
-                return res
+    def _array_chunks(self, arr):
+        """Векторизованный путь для целочисленных массивов numpy"""
+        for start in range(0, len(arr), self.chunk_size):
+            chunk = arr[start:start + self.chunk_size]
+            self.grow(int(chunk.max()))
+            yield chunk[self.fib_mask(chunk)].tolist()
 
-    @staticmethod
-    def _fib_up_to(n):
-        """Вернуть множество чисел Фибоначчи до n включительно"""
-        fibs = {0, 1}
-        a, b = 0, 1
+    def fib_mask(self, arr):
+        """Булева маска элементов массива arr, входящих в ряд Фибоначчи"""
+        fibs = [f for f in self.fib_set if f <= np.iinfo(arr.dtype).max]
+        return np.isin(arr, np.array(fibs, dtype=arr.dtype))
+
+    def grow(self, n):
+        """Дополнить fib_set числами Фибоначчи до n включительно"""
+        a, b = self._a, self._b
         while b <= n:
             a, b = b, a + b
-            fibs.add(a)
-        return fibs
+            self.fib_set.add(a)
+        self._a, self._b = a, b
+
+    @staticmethod
+    def _is_int_array(obj):
+        return (np is not None and isinstance(obj, np.ndarray)
+                and obj.ndim == 1 and np.issubdtype(obj.dtype, np.integer))
 
 
-# пример
-lst = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 1]
-print(list(FibonacchiLst(lst)))
+if __name__ == "__main__":
+    # пример
+    lst = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 1]
+    print(list(FibonacchiLst(lst)))
@@ -0,0 +1,139 @@
+"""
+Параллельный поиск чисел Фибоначчи в больших бинарных файлах целых чисел.
+
+Файл отображается в память (mmap) и делится на блоки, которые
+обрабатываются в пуле процессов. Результаты отдаются потоком в порядке
+следования блоков, поэтому весь файл никогда не загружается целиком.
+Числа в файле хранятся подряд в машинном порядке байт, формат задаётся
+кодом типа модуля array ('q' — int64, 'i' — int32 и т.д.).
+"""
+import mmap
+import os
+import sys
+import time
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from even_numbers_iterator import FibonacchiLst, np
+
+# элементов в одном блоке по умолчанию (~32 МиБ для int64)
+CHUNK_ITEMS = 1 << 22
+# целочисленные коды типов модуля array
+INT_TYPECODES = "bBhHiIlLqQ"
+
+
+def _scan_chunk(path, typecode, start, stop, with_offsets):
+    """Обработать элементы [start, stop) файла, вернуть (значения, смещения)"""
+    itemsize = array(typecode).itemsize
+    fl = FibonacchiLst(())
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mv = memoryview(mm)[start * itemsize:stop * itemsize].cast(typecode)
+        arr = None
+        try:
+            if np is not None:
+                arr = np.frombuffer(mv, dtype=np.dtype(typecode))
+                fl.grow(int(arr.max()))
+                idx = np.flatnonzero(fl.fib_mask(arr))
+                values = arr[idx].tolist()
+                offsets = (idx + start).tolist() if with_offsets else None
+            else:
+                fl.grow(max(mv))
+                values = list(filter(fl.fib_set.__contains__, mv))
+                offsets = None
+                if with_offsets:
+                    fib_set = fl.fib_set
+                    offsets = [i for i, v in enumerate(mv, start) if v in fib_set]
+        finally:
+            # буфер mmap нельзя закрыть, пока на него ссылается массив
+            del arr
+            mv.release()
+    return values, offsets
+
+
+class FibonacchiFileScan:
+    """Итератор по числам Фибоначчи из бинарного файла целых чисел.
+
+    При offsets=True выдаёт пары (индекс элемента в файле, значение).
+    После обхода в stats лежит статистика пропускной способности.
+    """
+
+    def __init__(self, path, typecode="q", chunk_items=CHUNK_ITEMS,
+                 workers=None, offsets=False):
+        self.path = path
+        self.typecode = typecode
+        self.chunk_items = chunk_items
+        self.workers = workers or os.cpu_count() or 1
+        self.offsets = offsets
+        self.stats = {}
+
+        if typecode not in INT_TYPECODES:
+            raise ValueError(
+                f"Ожидается целочисленный код типа ({INT_TYPECODES}), получен {typecode!r}")
+        itemsize = array(typecode).itemsize
+        size = os.path.getsize(path)
+        if size % itemsize:
+            raise ValueError(
+                f"Размер файла {size} не кратен размеру элемента {itemsize}")
+        self.total_items = size // itemsize
+
+    def _ranges(self):
+        for start in range(0, self.total_items, self.chunk_items):
+            yield start, min(start + self.chunk_items, self.total_items)
+
+    def _results(self):
+        """Результаты по блокам в исходном порядке"""
+        args = (self.path, self.typecode)
+        if self.workers == 1:
+            for start, stop in self._ranges():
+                yield _scan_chunk(*args, start, stop, self.offsets)
+            return
+
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            # держим в работе ограниченное число блоков, чтобы память
+            # не росла вместе с размером файла
+            pending = deque()
+            for start, stop in self._ranges():
+                pending.append(pool.submit(_scan_chunk, *args, start, stop, self.offsets))
+                if len(pending) >= 2 * self.workers:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
+
+    def __iter__(self):
+        t0 = time.perf_counter()
+        matches = 0
+        for values, offsets in self._results():
+            matches += len(values)
+            if self.offsets:
+                yield from zip(offsets, values)
+            else:
+                yield from values
+        self._update_stats(time.perf_counter() - t0, matches)
+
+    def _update_stats(self, seconds, matches):
+        itemsize = array(self.typecode).itemsize
+        seconds = max(seconds, 1e-9)
+        self.stats = {
+            "items": self.total_items,
+            "matches": matches,
+            "seconds": seconds,
+            "items_per_sec": self.total_items / seconds,
+            "mb_per_sec": self.total_items * itemsize / seconds / 2 ** 20,
+            "workers": self.workers,
+        }
+
+    def report(self):
+        """Строка со статистикой последнего обхода"""
+        s = self.stats
+        return (f"{s['items']} элементов, {s['matches']} совпадений за "
+                f"{s['seconds']:.3f} с: {s['items_per_sec']:.0f} эл/с, "
+                f"{s['mb_per_sec']:.1f} МиБ/с ({s['workers']} процессов)")
+
+
+if __name__ == "__main__":
+    # пример: python fib_file_scan.py data.bin [q]
+    scan = FibonacchiFileScan(sys.argv[1], *sys.argv[2:3])
+    for _ in scan:
+        pass
+    print(scan.report())
@@ -0,0 +1,61 @@
+import io
+import os
+import runpy
+
+import pytest
+
+# путь до файла рядом с тестом
+MODULE_PATH = os.path.join(os.path.dirname(__file__), "even_numbers_iterator.py")
+
+
+def load_module():
+    """Запускаем модуль и возвращаем его namespace"""
+    return runpy.run_path(MODULE_PATH)
+
+
+def test_filters_list():
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    lst = [0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 1]
+    assert list(FibonacchiLst(lst)) == [0, 1, 2, 3, 5, 8, 1]
+
+
+def test_empty_input():
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    assert list(FibonacchiLst([])) == []
+
+
+def test_accepts_generator_in_chunks():
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    gen = (x for x in range(1000))
+    result = list(FibonacchiLst(gen, chunk_size=7))
+    assert result == [0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987]
+
+
+def test_fib_set_grows_with_input():
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    # большие значения появляются только в последнем блоке
+    data = [4, 5, 6] * 10 + [10 ** 20, 12200160415121876738]
+    it = FibonacchiLst(iter(data), chunk_size=5)
+    assert list(it) == [5] * 10 + [12200160415121876738]
+
+
+def test_accepts_file():
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    f = io.StringIO("1\n4\n13\n14\n")
+    assert list(FibonacchiLst(int(line) for line in f)) == [1, 13]
+
+
+def test_numpy_vectorized_path():
+    np = pytest.importorskip("numpy")
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    arr = np.arange(-5, 100, dtype=np.int64)
+    result = list(FibonacchiLst(arr, chunk_size=16))
+    assert result == [0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89]
+    assert all(type(x) is int for x in result)
+
+
+@pytest.mark.parametrize("chunk_size", [0, -1])
+def test_rejects_invalid_chunk_size(chunk_size):
+    FibonacchiLst = load_module()["FibonacchiLst"]
+    with pytest.raises(ValueError):
+        FibonacchiLst([1, 2, 3], chunk_size=chunk_size)
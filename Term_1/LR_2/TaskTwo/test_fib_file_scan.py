@@ -0,0 +1,52 @@
+from array import array
+
+import pytest
+
+from fib_file_scan import FibonacchiFileScan
+
+FIBS = {0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89, 144, 233, 377, 610, 987}
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.bin"
+    data = array("q", range(1000))
+    with open(path, "wb") as f:
+        data.tofile(f)
+    return path
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_scan_values_in_order(data_file, workers):
+    scan = FibonacchiFileScan(data_file, chunk_items=64, workers=workers)
+    assert list(scan) == sorted(FIBS)
+
+
+def test_scan_offsets(tmp_path):
+    path = tmp_path / "data.bin"
+    with open(path, "wb") as f:
+        array("i", [4, 8, 7, 13, 13]).tofile(f)
+    scan = FibonacchiFileScan(path, typecode="i", chunk_items=2, workers=2, offsets=True)
+    assert list(scan) == [(1, 8), (3, 13), (4, 13)]
+
+
+def test_scan_reports_throughput(data_file):
+    scan = FibonacchiFileScan(data_file, chunk_items=100, workers=1)
+    list(scan)
+    assert scan.stats["items"] == 1000
+    assert scan.stats["matches"] == len(FIBS)
+    assert scan.stats["items_per_sec"] > 0
+    assert "МиБ/с" in scan.report()
+
+
+def test_scan_rejects_truncated_file(tmp_path):
+    path = tmp_path / "bad.bin"
+    path.write_bytes(b"\x00" * 7)
+    with pytest.raises(ValueError):
+        FibonacchiFileScan(path)
+
+
+@pytest.mark.parametrize("typecode", ["d", "f", "u"])
+def test_scan_rejects_non_integer_typecode(data_file, typecode):
+    with pytest.raises(ValueError):
+        FibonacchiFileScan(data_file, typecode=typecode)
@@ -0,0 +1,196 @@
+"""
+Бенчмарки генераторов и итераторов ЛР №2.
+
+Для fib_elem_gen, my_genn и FibonacchiLst на разных размерах входа
+измеряется время и пиковая память в пересчёте на один элемент.
+Результаты каждого запуска дописываются в results.jsonl, а сводка
+сравнивается с предыдущим запуском, чтобы изменения алгоритмов
+можно было оценивать объективно.
+
+Запуск: python bench_lr2.py [--sizes 10 1000 10000] [--cache-bytes N] [--no-save]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import runpy
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+from itertools import islice
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+LR_DIR = os.path.dirname(HERE)
+HISTORY_PATH = os.path.join(HERE, "results.jsonl")
+
+# от маленьких n до очень больших; my_genn возвращает весь список,
+# поэтому на больших n память растёт квадратично по числу бит
+DEFAULT_SIZES = [10, 1_000, 10_000, 30_000]
+# для FibonacchiLst размер входа в элементах
+DEFAULT_LIST_SIZES = [1_000, 100_000, 1_000_000]
+
+
+def load_namespaces():
+    gen_fib = runpy.run_path(os.path.join(LR_DIR, "TaskOne", "gen_fib.py"))
+    iterator = runpy.run_path(os.path.join(LR_DIR, "TaskTwo", "even_numbers_iterator.py"))
+    return gen_fib, iterator
+
+
+def measure(fn, repeat=3):
+    """Лучшее время из repeat запусков и пиковая память отдельного запуска"""
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def make_cases(gen_fib, iterator, sizes, list_sizes):
+    """Список (имя, n, функция) для замера"""
+    fib_elem_gen = gen_fib["fib_elem_gen"]
+    my_genn = gen_fib["my_genn"]
+    fib_cache = gen_fib["fib_cache"]
+    FibonacchiLst = iterator["FibonacchiLst"]
+
+    def elem_gen(n):
+        fib_cache.clear()
+        for _ in islice(fib_elem_gen(), n):
+            pass
+
+    def genn_cold(n):
+        fib_cache.clear()
+        my_genn().send(n)
+
+    def genn_warm(n):
+        # кэш уже заполнен предыдущим запросом той же длины
+        my_genn().send(n)
+
+    def fib_lst(data):
+        for _ in FibonacchiLst(data):
+            pass
+
+    cases = []
+    for n in sizes:
+        cases.append(("fib_elem_gen", n, lambda n=n: elem_gen(n)))
+        cases.append(("my_genn_cold", n, lambda n=n: genn_cold(n)))
+        cases.append(("my_genn_warm", n, lambda n=n: genn_warm(n)))
+
+    rnd = random.Random(0)
+    for n in list_sizes:
+        data = [rnd.randrange(10 ** 6) for _ in range(n)]
+        cases.append(("FibonacchiLst", n, lambda data=data: fib_lst(data)))
+    return cases
+
+
+def run(sizes, list_sizes, repeat=3, cache_bytes=None):
+    """Прогнать все замеры.
+
+    cache_bytes — лимит общего кэша Фибоначчи на время прогона; по умолчанию
+    кэш не ограничен, чтобы my_genn_warm действительно читал всё из кэша.
+    """
+    gen_fib, iterator = load_namespaces()
+    fib_cache = gen_fib["fib_cache"]
+    fib_cache.max_bytes = cache_bytes
+    results = []
+    # печать внутри my_genn не должна попадать в замеры
+    stdout, sys.stdout = sys.stdout, open(os.devnull, "w")
+    try:
+        for name, n, fn in make_cases(gen_fib, iterator, sizes, list_sizes):
+            seconds, peak = measure(fn, repeat)
+            result = {
+                "name": name,
+                "n": n,
+                "seconds": seconds,
+                "ns_per_elem": seconds / n * 1e9,
+                "peak_bytes_per_elem": peak / n,
+            }
+            note = ""
+            if name == "my_genn_warm":
+                # при упоре в лимит кэша часть ряда пересчитывается заново
+                result["cached_terms"] = len(fib_cache)
+                if len(fib_cache) < n:
+                    note = f"  (в кэше только {len(fib_cache)} эл., упор в лимит)"
+            results.append(result)
+            print(f"{name:>14} n={n:<9} {result['ns_per_elem']:>12.1f} нс/эл "
+                  f"{result['peak_bytes_per_elem']:>12.1f} Б/эл{note}", file=stdout)
+    finally:
+        sys.stdout.close()
+        sys.stdout = stdout
+    return results
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=HERE,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def load_history(path=HISTORY_PATH):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def save_run(results, path=HISTORY_PATH):
+    record = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "results": results,
+    }
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record, ensure_ascii=False) + "\n")
+    return record
+
+
+def compare(previous, results, out=None):
+    """Сравнить время и пиковую память на элемент с предыдущим запуском"""
+    old = {(r["name"], r["n"]): r for r in previous["results"]}
+    print(f"\nСравнение с запуском {previous['timestamp']} ({previous['commit']}):", file=out)
+    for r in results:
+        prev = old.get((r["name"], r["n"]))
+        if prev is None:
+            continue
+        time_ratio = r["ns_per_elem"] / prev["ns_per_elem"]
+        mem_ratio = (r["peak_bytes_per_elem"] / prev["peak_bytes_per_elem"]
+                     if prev["peak_bytes_per_elem"] else float("nan"))
+        print(f"{r['name']:>14} n={r['n']:<9} время x{time_ratio:.2f}  "
+              f"память x{mem_ratio:.2f}", file=out)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--list-sizes", type=int, nargs="+", default=DEFAULT_LIST_SIZES)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--cache-bytes", type=int, default=None,
+                        help="лимит кэша Фибоначчи в байтах (по умолчанию без лимита)")
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--no-save", action="store_true")
+    args = parser.parse_args(argv)
+
+    results = run(args.sizes, args.list_sizes, args.repeat, args.cache_bytes)
+    history = load_history(args.history)
+    if history:
+        compare(history[-1], results)
+    if not args.no_save:
+        save_run(results, args.history)
+    return results
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,33 @@
+from bench_lr2 import load_history, run, save_run
+
+
+def test_bench_smoke_and_history(tmp_path):
+    results = run([10, 100], [100], repeat=1)
+    names = {r["name"] for r in results}
+    assert names == {"fib_elem_gen", "my_genn_cold", "my_genn_warm", "FibonacchiLst"}
+    assert all(r["ns_per_elem"] > 0 for r in results)
+
+    path = tmp_path / "results.jsonl"
+    save_run(results, path)
+    save_run(results, path)
+    history = load_history(path)
+    assert len(history) == 2
+    assert history[-1]["results"] == results
+
+
+def test_bench_warm_run_is_fully_cached():
+    results = run([30_000], [10], repeat=1)
+    warm = next(r for r in results if r["name"] == "my_genn_warm")
+    assert warm["cached_terms"] >= 30_000
+
+
+def test_compare_reports_memory(capsys):
+    from bench_lr2 import compare
+
+    old = {"timestamp": "t", "commit": "c", "results": [
+        {"name": "x", "n": 1, "ns_per_elem": 10.0, "peak_bytes_per_elem": 4.0}]}
+    new = [{"name": "x", "n": 1, "ns_per_elem": 20.0, "peak_bytes_per_elem": 2.0}]
+    compare(old, new)
+    out = capsys.readouterr().out
+    assert "время x2.00" in out
+    assert "память x0.50" in out
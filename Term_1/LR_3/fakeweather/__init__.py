@@ -1,3 +1,12 @@
-from .client import FakeWeatherClient
+from .api import FakeWeather
+from .cache import TTLCache
 
-__all__ = ["FakeWeatherClient"]
+__all__ = ["FakeWeather", "FakeWeatherClient", "TTLCache"]
+
+
+def __getattr__(name):
+    # клиент тянет aiohttp, поэтому импортируем его только по запросу
+    if name == "FakeWeatherClient":
+        from .client import FakeWeatherClient
+        return FakeWeatherClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
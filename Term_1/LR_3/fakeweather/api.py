@@ -2,17 +2,154 @@
 FakeWeather API client.
 Симулирует работу с OpenWeather API (для учебных целей).
 """
+import math
 import random
+from array import array
+from datetime import datetime, timezone
+
+try:
+    import numpy as np
+except ImportError:  # без numpy пакетная генерация идёт через random
+    np = None
+
+CONDITIONS = ("sunny", "cloudy", "rainy", "snowy")
+TEMP_MIN, TEMP_MAX = -10, 35
+
+# параметры почасового случайного блуждания вокруг климатической нормы:
+# доля отклонения, сохраняющаяся за час, и шум за один шаг
+TEMP_PHI, TEMP_SIGMA = 0.9, 0.8
+CLOUD_PHI, CLOUD_SIGMA = 0.95, 0.08
+
 
 class FakeWeather:
 
-    def __init__(self, api_key: str = "demo"):
+    def __init__(self, api_key: str = "demo", seed: int = None):
         self.api_key = api_key
+        # при заданном seed результаты воспроизводимы от запуска к запуску
+        self.seed = seed
+        if np is not None:
+            self._rng = np.random.default_rng(seed)
+        else:
+            self._rng = random.Random(seed) if seed is not None else random
+
+    def get_weather_many(self, cities) -> dict:
+        """Погода для пачки городов за один проход.
+
+        Возвращает колонки одинаковой длины: "city" — список названий,
+        "temperature" и "condition" — массивы значений.
+        """
+        cities = list(cities)
+        n = len(cities)
+        if np is not None:
+            temperature = np.round(self._rng.uniform(TEMP_MIN, TEMP_MAX, n), 1)
+            condition = np.asarray(CONDITIONS)[self._rng.integers(0, len(CONDITIONS), n)]
+        else:
+            uniform, choice = self._rng.uniform, self._rng.choice
+            temperature = array("d", [round(uniform(TEMP_MIN, TEMP_MAX), 1) for _ in range(n)])
+            condition = [choice(CONDITIONS) for _ in range(n)]
+        return {"city": cities, "temperature": temperature, "condition": condition}
+
+    def forecast_stream(self, cities, hours: int = None, batch_hours: int = 24,
+                        start: datetime = None):
+        """Генератор почасовых рядов погоды для многих городов.
+
+        У каждого города своя климатическая норма и суточная амплитуда,
+        температура и облачность меняются как случайное блуждание с
+        возвратом к норме, поэтому соседние часы связаны между собой.
+        Каждая пачка — колонки "time" (unix-время), "city", "temperature"
+        и "condition" длиной batch_hours * len(cities), час за часом.
+        При hours=None поток бесконечен; в памяти держится одна пачка.
+        Время считается в UTC: start без часового пояса трактуется как UTC
+        и округляется вниз до часа, суточный ход тоже идёт по UTC.
+        """
+        if batch_hours < 1:
+            raise ValueError("batch_hours должен быть не меньше 1")
+        cities = list(cities)
+        n = len(cities)
+        start = start or datetime.now(timezone.utc)
+        if start.tzinfo is None:
+            start = start.replace(tzinfo=timezone.utc)
+        t = int(start.timestamp()) // 3600 * 3600
+        baseline = self._uniform(-5, 25, n)
+        amplitude = self._uniform(2, 8, n)
+        deviation = np.zeros(n) if np is not None else [0.0] * n
+        # облачность — отклонение от среднего уровня 0.5
+        cloud = self._uniform(-0.5, 0.5, n)
+
+        done = 0
+        while hours is None or done < hours:
+            size = batch_hours if hours is None else min(batch_hours, hours - done)
+            times, temps, conditions = [], [], []
+            for _ in range(size):
+                # суточный ход: минимум около 3 часов UTC, максимум около 15
+                daily = math.sin(2 * math.pi * ((t // 3600) % 24 - 9) / 24)
+                deviation = self._walk(deviation, TEMP_PHI, TEMP_SIGMA)
+                cloud = self._walk(cloud, CLOUD_PHI, CLOUD_SIGMA)
+                if np is not None:
+                    cloud = np.clip(cloud, -0.5, 0.5)
+                    temp = np.clip(baseline + amplitude * daily + deviation, TEMP_MIN, TEMP_MAX)
+                    temps.append(np.round(temp, 1))
+                    conditions.append(self._conditions(cloud, temp))
+                else:
+                    cloud = [min(0.5, max(-0.5, c)) for c in cloud]
+                    temp = [min(TEMP_MAX, max(TEMP_MIN, b + a * daily + d))
+                            for b, a, d in zip(baseline, amplitude, deviation)]
+                    temps.extend(round(x, 1) for x in temp)
+                    conditions.extend(map(self._condition, cloud, temp))
+                times.append(t)
+                t += 3600
+            done += size
+
+            if np is not None:
+                yield {
+                    "time": np.repeat(np.asarray(times, dtype=np.int64), n),
+                    "city": np.tile(np.asarray(cities, dtype=object), size),
+                    "temperature": np.concatenate(temps),
+                    "condition": np.concatenate(conditions),
+                }
+            else:
+                yield {
+                    "time": array("q", [x for x in times for _ in range(n)]),
+                    "city": cities * size,
+                    "temperature": array("d", temps),
+                    "condition": conditions,
+                }
+
+    def _uniform(self, low, high, n):
+        if np is not None:
+            return self._rng.uniform(low, high, n)
+        return [self._rng.uniform(low, high) for _ in range(n)]
+
+    def _walk(self, values, phi, sigma):
+        """Один шаг блуждания: x = phi * x + sigma * N(0, 1)"""
+        if np is not None:
+            return phi * values + sigma * self._rng.standard_normal(len(values))
+        gauss = self._rng.gauss
+        return [phi * x + sigma * gauss(0, 1) for x in values]
+
+    @staticmethod
+    def _condition(cloud: float, temp: float) -> str:
+        if cloud < -0.15:
+            return "sunny"
+        if cloud < 0.2:
+            return "cloudy"
+        return "snowy" if temp < 0 else "rainy"
+
+    @staticmethod
+    def _conditions(cloud, temp):
+        """Векторный вариант _condition для массивов numpy"""
+        precip = np.where(temp < 0, "snowy", "rainy")
+        return np.where(cloud < -0.15, "sunny", np.where(cloud < 0.2, "cloudy", precip))
 
     def get_weather(self, city: str) -> dict:
         """Возвращает случайную погоду для города"""
+        return self.row(self.get_weather_many([city]), 0)
+
+    @staticmethod
+    def row(batch: dict, idx: int) -> dict:
+        """Одна запись пачки в виде привычного словаря"""
         return {
-            "city": city,
-            "temperature": round(random.uniform(-10, 35), 1),
-            "condition": random.choice(["sunny", "cloudy", "rainy", "snowy"]),
+            "city": batch["city"][idx],
+            "temperature": float(batch["temperature"][idx]),
+            "condition": str(batch["condition"][idx]),
         }
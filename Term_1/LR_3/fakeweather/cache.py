@@ -0,0 +1,54 @@
+"""
+TTL-кэш с вытеснением давно не использованных записей (LRU).
+"""
+import time
+from collections import OrderedDict
+
+
+class TTLCache:
+
+    def __init__(self, ttl: float = 600, maxsize: int = 1024, clock=time.monotonic):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._clock = clock
+        # ключ -> (момент истечения, значение); порядок — от старых к свежим
+        self._data = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key, default=None):
+        """Значение по ключу, если оно есть и ещё не устарело"""
+        item = self._data.get(key)
+        if item is not None:
+            expires, value = item
+            if expires > self._clock():
+                self._data.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._data[key]
+        self.misses += 1
+        return default
+
+    def set(self, key, value) -> None:
+        """Сохранить значение, вытеснив самое старое при переполнении"""
+        self._data[key] = (self._clock() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._data),
+            "hit_rate": self.hits / total if total else 0.0,
+        }
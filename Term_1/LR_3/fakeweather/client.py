@@ -0,0 +1,231 @@
+"""
+Асинхронный клиент OpenWeather-совместимого API.
+
+Использует одну сессию aiohttp с пулом соединений, собирает промахи
+кэша от одновременных вызовов в пачки (/data/2.5/group), не запрашивает
+один город дважды, пока ответ на него ещё в пути, и хранит ответы
+в TTL-кэше с LRU-вытеснением.
+"""
+import asyncio
+import random
+import time
+
+import aiohttp
+
+from .cache import TTLCache
+from .server import GROUP_SEPARATOR
+
+# weather[0].main из ответа OpenWeather -> состояние FakeWeather
+CONDITIONS = {"Clear": "sunny", "Clouds": "cloudy", "Rain": "rainy", "Snow": "snowy"}
+
+
+def parse_record(record: dict) -> dict:
+    """Ответ OpenWeather в формате FakeWeather.get_weather"""
+    main = record["weather"][0]["main"]
+    return {
+        "city": record["name"],
+        "temperature": record["main"]["temp"],
+        "condition": CONDITIONS.get(main, main.lower()),
+    }
+
+
+def percentile(values, q: float) -> float:
+    """Перцентиль q (0..100) методом ближайшего ранга"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    idx = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[idx]
+
+
+class FakeWeatherClient:
+
+    def __init__(self, base_url: str, api_key: str = "demo", ttl: float = 600,
+                 cache_size: int = 1024, limit: int = 100, batch_size: int = 20,
+                 batch_delay: float = 0.005, timeout: float = 30):
+        self.base_url = base_url.rstrip("/")
+        self.api_key = api_key
+        self.cache = TTLCache(ttl, cache_size) if ttl else None
+        self.limit = limit
+        self.batch_size = batch_size
+        # сколько ждать других вызовов, прежде чем отправить неполную пачку
+        self.batch_delay = batch_delay
+        self.timeout = timeout
+        self.latencies = []   # время каждого вызова get_weather*, в секундах
+        self.requests = 0     # число HTTP-запросов к серверу
+        self._session = None
+        self._inflight = {}   # город -> Future с ответом, который ещё в пути
+        self._pending = []    # города, ждущие отправки в следующей пачке
+        self._flush_handle = None
+        self._tasks = set()
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def open(self) -> None:
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.limit, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(
+                connector=connector, timeout=aiohttp.ClientTimeout(total=self.timeout))
+
+    async def close(self) -> None:
+        self._flush()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _get(self, path: str, cities) -> dict:
+        await self.open()
+        self.requests += 1
+        params = {"q": GROUP_SEPARATOR.join(cities), "appid": self.api_key}
+        async with self._session.get(f"{self.base_url}{path}", params=params) as response:
+            response.raise_for_status()
+            return await response.json()
+
+    @staticmethod
+    def _match(batch, data) -> dict:
+        """Сопоставить записи ответа /group с запрошенными городами по имени"""
+        records = data.get("list", [])
+        if data.get("cnt") != len(batch) or len(records) != len(batch):
+            raise ValueError(
+                f"Ожидалось {len(batch)} записей, сервер вернул {data.get('cnt')}")
+        by_name = {record["name"]: record for record in records}
+        missing = [city for city in batch if city not in by_name]
+        if missing:
+            raise ValueError(f"В ответе нет городов: {', '.join(missing)}")
+        return {city: parse_record(by_name[city]) for city in batch}
+
+    def _flush(self) -> None:
+        """Отправить накопленные города одной пачкой"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.ensure_future(self._fetch_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _fetch_batch(self, batch) -> None:
+        # future может быть уже отменён, если все его ожидающие ушли,
+        # поэтому результат ставим только в ещё не завершённые
+        try:
+            rows = self._match(batch, await self._get("/data/2.5/group", batch))
+        except Exception as e:
+            for city in batch:
+                future = self._inflight.pop(city)
+                if not future.done():
+                    future.set_exception(e)
+                    # ожидающих могло не остаться: помечаем ошибку полученной,
+                    # чтобы не было "Future exception was never retrieved"
+                    future.exception()
+            return
+        for city, row in rows.items():
+            if self.cache is not None:
+                self.cache.set(city, row)
+            future = self._inflight.pop(city)
+            if not future.done():
+                future.set_result(row)
+
+    async def get_weather(self, city: str) -> dict:
+        """Погода для одного города"""
+        return (await self.get_weather_many([city]))[city]
+
+    async def get_weather_many(self, cities) -> dict:
+        """Погода для нескольких городов: словарь город -> запись.
+
+        Ответы из кэша возвращаются сразу. Остальные города вместе
+        с промахами других одновременных вызовов уходят пачками по
+        batch_size; город, ответ на который уже в пути, не запрашивается
+        повторно.
+        """
+        t0 = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        result = {}
+        waiting = {}
+        for city in dict.fromkeys(cities):
+            cached = self.cache.get(city) if self.cache is not None else None
+            if cached is not None:
+                result[city] = cached
+                continue
+            future = self._inflight.get(city)
+            if future is None:
+                future = self._inflight[city] = loop.create_future()
+                self._pending.append(city)
+                if len(self._pending) >= self.batch_size:
+                    self._flush()
+                elif self._flush_handle is None:
+                    self._flush_handle = loop.call_later(self.batch_delay, self._flush)
+            waiting[city] = future
+
+        if waiting:
+            # shield: отмена одного вызова не должна отменять общий future,
+            # который ждут другие вызовы с тем же городом
+            rows = await asyncio.gather(*map(asyncio.shield, waiting.values()))
+            result.update(zip(waiting, rows))
+
+        self.latencies.append(time.perf_counter() - t0)
+        return result
+
+    def latency_stats(self) -> dict:
+        """Число вызовов и перцентили задержки в миллисекундах"""
+        return {
+            "calls": len(self.latencies),
+            "p50_ms": percentile(self.latencies, 50) * 1000,
+            "p95_ms": percentile(self.latencies, 95) * 1000,
+            "p99_ms": percentile(self.latencies, 99) * 1000,
+        }
+
+
+async def measure(base_url: str, cities, requests: int = 1000, concurrency: int = 50,
+                  per_call: int = 1, **client_kwargs) -> dict:
+    """Нагрузочный прогон: requests вызовов по per_call случайных городов.
+
+    Одновременные вызовы проходят через пакетирование клиента, поэтому
+    upstream_requests показывает, сколько HTTP-запросов реально ушло.
+    Возвращает пропускную способность, перцентили задержки и
+    статистику кэша — удобно сравнивать запуск с ttl=0 и с кэшем,
+    с batch_size=1 и с пачками.
+    """
+    rnd = random.Random(0)
+    picks = [[rnd.choice(cities) for _ in range(per_call)] for _ in range(requests)]
+    sem = asyncio.Semaphore(concurrency)
+
+    async with FakeWeatherClient(base_url, **client_kwargs) as client:
+        async def one(group):
+            async with sem:
+                await client.get_weather_many(group)
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(one(g) for g in picks))
+        elapsed = time.perf_counter() - t0
+
+        stats = client.latency_stats()
+        stats["rps"] = requests / elapsed
+        stats["upstream_requests"] = client.requests
+        if client.cache is not None:
+            stats["cache"] = client.cache.stats()
+        return stats
+
+
+async def _demo():
+    from .server import start_server
+
+    runner, url = await start_server(latency=0.02, jitter=0.01)
+    try:
+        cities = [f"city{i}" for i in range(200)]
+        print("без кэша и пачек:", await measure(url, cities, ttl=0, batch_size=1))
+        print("без кэша:        ", await measure(url, cities, ttl=0))
+        print("с кэшем:         ", await measure(url, cities, ttl=60))
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == "__main__":
+    asyncio.run(_demo())
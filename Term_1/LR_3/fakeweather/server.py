@@ -0,0 +1,84 @@
+"""
+Локальный сервер-заглушка OpenWeather API.
+Отдаёт ответы в формате OpenWeather и имитирует сетевую задержку.
+"""
+import asyncio
+import random
+
+from aiohttp import web
+
+from .api import FakeWeather
+
+# наши состояния погоды -> поле weather[0].main в ответе OpenWeather
+OWM_MAIN = {"sunny": "Clear", "cloudy": "Clouds", "rainy": "Rain", "snowy": "Snow"}
+# разделитель городов в /data/2.5/group: запятая занята форматом "London,uk"
+GROUP_SEPARATOR = "|"
+
+
+def owm_record(row: dict) -> dict:
+    """Запись FakeWeather в формате ответа /data/2.5/weather"""
+    return {
+        "name": row["city"],
+        "weather": [{"main": OWM_MAIN[row["condition"]], "description": row["condition"]}],
+        "main": {"temp": row["temperature"]},
+        "cod": 200,
+    }
+
+
+def make_app(api_key: str = "demo", latency: float = 0.05, jitter: float = 0.02,
+             seed: int = None) -> web.Application:
+    """Приложение aiohttp с эндпоинтами /data/2.5/weather и /data/2.5/group"""
+    weather = FakeWeather(api_key, seed=seed)
+    rnd = random.Random(seed)
+
+    async def delay():
+        await asyncio.sleep(max(0.0, rnd.gauss(latency, jitter)))
+
+    def check_key(request):
+        if request.query.get("appid") != api_key:
+            raise web.HTTPUnauthorized(
+                text='{"cod": 401, "message": "Invalid API key"}',
+                content_type="application/json")
+
+    def cities_from(request, separator=None):
+        q = request.query.get("q", "")
+        parts = q.split(separator) if separator else [q]
+        cities = [c.strip() for c in parts if c.strip()]
+        if not cities:
+            raise web.HTTPBadRequest(
+                text='{"cod": "400", "message": "Nothing to geocode"}',
+                content_type="application/json")
+        return cities
+
+    async def get_weather(request):
+        check_key(request)
+        # как и OpenWeather, /weather берёт только один город
+        city = cities_from(request)[0]
+        await delay()
+        return web.json_response(owm_record(weather.get_weather(city)))
+
+    async def get_group(request):
+        check_key(request)
+        batch = weather.get_weather_many(cities_from(request, GROUP_SEPARATOR))
+        await delay()
+        records = [owm_record(FakeWeather.row(batch, i)) for i in range(len(batch["city"]))]
+        return web.json_response({"cnt": len(records), "list": records})
+
+    app = web.Application()
+    app.router.add_get("/data/2.5/weather", get_weather)
+    app.router.add_get("/data/2.5/group", get_group)
+    return app
+
+
+async def start_server(host: str = "127.0.0.1", port: int = 0, **kwargs):
+    """Запустить сервер; вернуть (runner, базовый URL). Остановка — runner.cleanup()"""
+    runner = web.AppRunner(make_app(**kwargs))
+    await runner.setup()
+    site = web.TCPSite(runner, host, port)
+    await site.start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
+
+
+if __name__ == "__main__":
+    web.run_app(make_app(), host="127.0.0.1", port=8081)
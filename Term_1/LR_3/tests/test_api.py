@@ -1,4 +1,6 @@
-from src import FakeWeather
+import pytest
+
+from fakeweather import FakeWeather
 
 def test_get_weather():
     api = FakeWeather()
@@ -6,3 +8,75 @@ def test_get_weather():
     assert "city" in result
     assert "temperature" in result
     assert "condition" in result
+
+
+def test_get_weather_many_columns():
+    api = FakeWeather()
+    cities = ["Moscow", "Kazan", "Omsk"]
+    batch = api.get_weather_many(cities)
+    assert list(batch["city"]) == cities
+    assert len(batch["temperature"]) == 3
+    assert len(batch["condition"]) == 3
+    assert all(-10 <= t <= 35 for t in batch["temperature"])
+
+
+def test_seeded_runs_are_reproducible():
+    cities = [f"city{i}" for i in range(100)]
+    first = FakeWeather(seed=42).get_weather_many(cities)
+    second = FakeWeather(seed=42).get_weather_many(cities)
+    assert list(first["temperature"]) == list(second["temperature"])
+    assert list(first["condition"]) == list(second["condition"])
+
+
+def test_get_weather_is_row_of_batch():
+    batch = FakeWeather(seed=1).get_weather_many(["Moscow"])
+    result = FakeWeather(seed=1).get_weather("Moscow")
+    assert result == FakeWeather.row(batch, 0)
+    assert isinstance(result["temperature"], float)
+
+
+def test_forecast_stream_batches():
+    from datetime import datetime, timezone
+
+    api = FakeWeather(seed=7)
+    cities = ["Moscow", "Kazan", "Omsk"]
+    start = datetime(2025, 1, 1, 0, 30, tzinfo=timezone.utc)
+    batches = list(api.forecast_stream(cities, hours=50, batch_hours=24, start=start))
+    assert [len(b["temperature"]) for b in batches] == [72, 72, 6]
+    first = batches[0]
+    assert list(first["city"][:4]) == ["Moscow", "Kazan", "Omsk", "Moscow"]
+    # 2025-01-01 00:00 UTC
+    assert first["time"][0] == 1735689600
+    assert first["time"][3] - first["time"][0] == 3600
+    assert all(c in {"sunny", "cloudy", "rainy", "snowy"} for c in first["condition"])
+
+
+def test_forecast_stream_is_continuous_and_lazy():
+    from itertools import islice
+
+    api = FakeWeather(seed=3)
+    stream = api.forecast_stream(["Moscow"], batch_hours=100)
+    temps = [t for batch in islice(stream, 5) for t in batch["temperature"]]
+    assert len(temps) == 500
+    # соседние часы связаны: скачки намного меньше размаха диапазона
+    jumps = [abs(b - a) for a, b in zip(temps, temps[1:])]
+    assert sum(jumps) / len(jumps) < 5
+    assert all(-10 <= t <= 35 for t in temps)
+
+
+def test_forecast_stream_seeded():
+    a = next(FakeWeather(seed=5).forecast_stream(["x", "y"], hours=10))
+    b = next(FakeWeather(seed=5).forecast_stream(["x", "y"], hours=10))
+    assert list(a["temperature"]) == list(b["temperature"])
+
+
+def test_forecast_stream_naive_start_is_utc():
+    from datetime import datetime
+
+    batch = next(FakeWeather(seed=1).forecast_stream(["x"], hours=1, start=datetime(2025, 1, 1, 5)))
+    assert batch["time"][0] == 1735689600 + 5 * 3600
+
+
+def test_forecast_stream_rejects_empty_batches():
+    with pytest.raises(ValueError):
+        next(FakeWeather().forecast_stream(["x"], batch_hours=0))
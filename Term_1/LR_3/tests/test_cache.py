@@ -0,0 +1,40 @@
+from fakeweather import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_cache_hit_and_miss():
+    cache = TTLCache(ttl=10)
+    assert cache.get("Moscow") is None
+    cache.set("Moscow", {"temperature": 1.0})
+    assert cache.get("Moscow") == {"temperature": 1.0}
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_entry_expires():
+    clock = FakeClock()
+    cache = TTLCache(ttl=10, clock=clock)
+    cache.set("Moscow", 1)
+    clock.now = 9.9
+    assert cache.get("Moscow") == 1
+    clock.now = 10.0
+    assert cache.get("Moscow") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used():
+    cache = TTLCache(ttl=10, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
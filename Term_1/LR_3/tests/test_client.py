@@ -0,0 +1,141 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from fakeweather import FakeWeatherClient
+from fakeweather.server import start_server
+
+
+def run(coro):
+    return asyncio.run(coro)
+
+
+def test_client_fetches_weather_from_server():
+    async def scenario():
+        runner, url = await start_server(latency=0, jitter=0, seed=1)
+        try:
+            async with FakeWeatherClient(url) as client:
+                return await client.get_weather("Moscow")
+        finally:
+            await runner.cleanup()
+
+    result = run(scenario())
+    assert result["city"] == "Moscow"
+    assert -10 <= result["temperature"] <= 35
+    assert result["condition"] in {"sunny", "cloudy", "rainy", "snowy"}
+
+
+def test_client_batches_and_caches():
+    async def scenario():
+        runner, url = await start_server(latency=0, jitter=0)
+        try:
+            async with FakeWeatherClient(url, batch_size=3) as client:
+                cities = [f"city{i}" for i in range(10)]
+                first = await client.get_weather_many(cities)
+                second = await client.get_weather_many(cities)
+                return first, second, client.cache.stats()
+        finally:
+            await runner.cleanup()
+
+    first, second, stats = run(scenario())
+    assert set(first) == {f"city{i}" for i in range(10)}
+    assert first == second
+    assert stats["hits"] == 10
+    assert stats["misses"] == 10
+
+
+def test_client_rejects_wrong_api_key():
+    import aiohttp
+
+    async def scenario():
+        runner, url = await start_server(api_key="secret", latency=0, jitter=0)
+        try:
+            async with FakeWeatherClient(url, api_key="wrong") as client:
+                await client.get_weather("Moscow")
+        finally:
+            await runner.cleanup()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        run(scenario())
+
+
+def test_client_handles_comma_in_city_name():
+    async def scenario():
+        runner, url = await start_server(latency=0, jitter=0)
+        try:
+            async with FakeWeatherClient(url) as client:
+                return await client.get_weather_many(["London,uk", "Paris"])
+        finally:
+            await runner.cleanup()
+
+    result = run(scenario())
+    assert result["London,uk"]["city"] == "London,uk"
+    assert result["Paris"]["city"] == "Paris"
+
+
+def test_client_coalesces_concurrent_misses():
+    async def scenario():
+        runner, url = await start_server(latency=0.01, jitter=0)
+        try:
+            async with FakeWeatherClient(url, ttl=0, batch_size=20) as client:
+                cities = ["Moscow", "Kazan", "Moscow", "Omsk", "Kazan"]
+                rows = await asyncio.gather(*(client.get_weather(c) for c in cities))
+                return rows, client.requests
+        finally:
+            await runner.cleanup()
+
+    rows, requests = run(scenario())
+    assert [r["city"] for r in rows] == ["Moscow", "Kazan", "Moscow", "Omsk", "Kazan"]
+    assert rows[0] == rows[2]
+    assert requests == 1
+
+
+def test_client_rejects_short_group_response():
+    from aiohttp import web
+
+    async def short_group(request):
+        return web.json_response({"cnt": 1, "list": [
+            {"name": "a", "weather": [{"main": "Clear"}], "main": {"temp": 1.0}}]})
+
+    async def scenario():
+        app = web.Application()
+        app.router.add_get("/data/2.5/group", short_group)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        host, port = runner.addresses[0][:2]
+        try:
+            async with FakeWeatherClient(f"http://{host}:{port}") as client:
+                await client.get_weather_many(["a", "b"])
+        finally:
+            await runner.cleanup()
+
+    with pytest.raises(ValueError):
+        run(scenario())
+
+
+def test_cancelled_caller_does_not_break_others():
+    async def scenario():
+        runner, url = await start_server(latency=0.2, jitter=0)
+        try:
+            async with FakeWeatherClient(url, ttl=0) as client:
+                cancelled = asyncio.ensure_future(client.get_weather_many(["Moscow", "Kazan"]))
+                other = asyncio.ensure_future(client.get_weather("Kazan"))
+                await asyncio.sleep(0.05)
+                cancelled.cancel()
+                with pytest.raises(asyncio.CancelledError):
+                    await cancelled
+                row = await other
+                inflight = dict(client._inflight)
+                later = await client.get_weather("Kazan")
+                return row, inflight, later
+        finally:
+            await runner.cleanup()
+
+    row, inflight, later = run(scenario())
+    assert row["city"] == "Kazan"
+    assert inflight == {}
+    assert later["city"] == "Kazan"
@@ -2,24 +2,34 @@ from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from typing import List
 import asyncio
 from currency_service import CurrencyService
+from observer import Observer
 from observers import EmailNotifier, LoggerObserver, ConsoleDisplay
 from websocket_observer import WebsocketObserver
-import uvicorn
+from settings import Settings
 from contextlib import asynccontextmanager
 from fastapi.responses import Response, HTMLResponse
 import json
 from datetime import datetime
 
+settings = Settings.from_env()
 websocket_observer = WebsocketObserver()
-currency_service = CurrencyService(update_interval=10)
+# сервис лёгкий: aiohttp и SSL подгружаются только при первом запросе к ЦБ РФ
+currency_service = CurrencyService(update_interval=settings.update_interval)
+
+def create_observers(settings: Settings) -> List[Observer]:
+    factories = {
+        "email": lambda: EmailNotifier(settings.notify_email),
+        "logger": lambda: LoggerObserver(settings.log_file),
+        "console": lambda: ConsoleDisplay(settings.console_currencies),
+        "websocket": lambda: websocket_observer,
+    }
+    return [factories[name]() for name in settings.observers]
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
 
-    currency_service.attach(EmailNotifier("admin@example.com"))
-    currency_service.attach(LoggerObserver())
-    currency_service.attach(ConsoleDisplay(['USD', 'EUR', 'GBP', 'CNY', 'JPY']))
-    currency_service.attach(websocket_observer)
+    for observer in create_observers(settings):
+        currency_service.attach(observer)
 
     asyncio.create_task(currency_service.start_monitoring())
     print("Приложение запущено и мониторинг активирован")
@@ -152,4 +162,5 @@ async def get_status():
     }
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,13 +1,11 @@
-import aiohttp
 import asyncio
 from typing import Dict, Any
 from datetime import datetime
-import xml.etree.ElementTree as ET
-import ssl
-import urllib.request
-import certifi
 from observer import Subject
 
+# aiohttp, certifi, ssl-контекст и разбор XML нужны только при первом
+# запросе к ЦБ РФ, поэтому импортируются лениво — так быстрее старт воркера
+
 class CurrencyService(Subject):
     def __init__(self, update_interval: int = 60):
         super().__init__()
@@ -15,6 +13,16 @@ class CurrencyService(Subject):
         self.previous_rates: Dict[str, float] = {}
         self.current_rates: Dict[str, float] = {}
         self.is_running = False
+        self._ssl_context = None
+
+    @property
+    def ssl_context(self):
+        """SSL-контекст с сертификатами certifi, создаётся при первом обращении"""
+        if self._ssl_context is None:
+            import ssl
+            import certifi
+            self._ssl_context = ssl.create_default_context(cafile=certifi.where())
+        return self._ssl_context
 
     def has_changes(self) -> bool:
 
@@ -31,12 +39,12 @@ class CurrencyService(Subject):
         return False
 
     async def fetch_currency_rates(self) -> Dict[str, Any]:
+        import aiohttp
+
         url = 'https://www.cbr.ru/scripts/XML_daily.asp'
 
         try:
-            ssl_context = ssl.create_default_context(cafile=certifi.where())
-
-            connector = aiohttp.TCPConnector(ssl=ssl_context, keepalive_timeout=30, limit=100)
+            connector = aiohttp.TCPConnector(ssl=self.ssl_context, keepalive_timeout=30, limit=100)
 
             timeout = aiohttp.ClientTimeout(total=30)
 
@@ -77,16 +85,16 @@ class CurrencyService(Subject):
     def _diagnose_ssl_issue(self):
 
         try:
+            import certifi
+            import urllib.request
 
             print("Диагностика SSL проблем...")
             cert_path = certifi.where()
             print(f"Путь к сертификатам: {cert_path}")
 
-            context = ssl.create_default_context(cafile=certifi.where())
-
             with urllib.request.urlopen(
                     "https://www.cbr.ru/scripts/XML_daily.asp",
-                    context=context,
+                    context=self.ssl_context,
                     timeout=10
             ) as response:
                 print("Диагностика: Прямое подключение работает!")
@@ -96,6 +104,7 @@ class CurrencyService(Subject):
             print("Попробуйте обновить сертификаты: pip install --upgrade certifi")
 
     def parse_xml_currency_rates(self, xml: str) -> Dict[str, Any]:
+        import xml.etree.ElementTree as ET
 
         try:
             xml_data_encoded = xml.encode('windows-1251')
@@ -0,0 +1,40 @@
+import os
+from dataclasses import dataclass, field
+from typing import List
+
+# наблюдатели, которые можно включить через CURRENCY_OBSERVERS
+OBSERVER_NAMES = ("email", "logger", "console", "websocket")
+
+
+def _split(value: str) -> List[str]:
+    return [item.strip() for item in value.split(",") if item.strip()]
+
+
+@dataclass
+class Settings:
+    update_interval: int = 10
+    observers: List[str] = field(default_factory=lambda: list(OBSERVER_NAMES))
+    notify_email: str = "admin@example.com"
+    log_file: str = "currency_changes.log"
+    console_currencies: List[str] = field(
+        default_factory=lambda: ['USD', 'EUR', 'GBP', 'CNY', 'JPY'])
+
+    @classmethod
+    def from_env(cls, env=os.environ) -> "Settings":
+        """Настройки из переменных окружения CURRENCY_*, остальное — по умолчанию"""
+        settings = cls()
+        if "CURRENCY_UPDATE_INTERVAL" in env:
+            settings.update_interval = int(env["CURRENCY_UPDATE_INTERVAL"])
+        if "CURRENCY_OBSERVERS" in env:
+            settings.observers = _split(env["CURRENCY_OBSERVERS"])
+        if "CURRENCY_NOTIFY_EMAIL" in env:
+            settings.notify_email = env["CURRENCY_NOTIFY_EMAIL"]
+        if "CURRENCY_LOG_FILE" in env:
+            settings.log_file = env["CURRENCY_LOG_FILE"]
+        if "CURRENCY_CONSOLE_CURRENCIES" in env:
+            settings.console_currencies = _split(env["CURRENCY_CONSOLE_CURRENCIES"])
+
+        unknown = set(settings.observers) - set(OBSERVER_NAMES)
+        if unknown:
+            raise ValueError(f"Неизвестные наблюдатели: {', '.join(sorted(unknown))}")
+        return settings
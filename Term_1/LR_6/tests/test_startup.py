@@ -0,0 +1,73 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from settings import Settings
+
+LR_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# модули, которые не должны загружаться при старте воркера
+HEAVY_MODULES = ["aiohttp", "certifi", "uvicorn", "urllib.request", "xml.etree.ElementTree"]
+
+
+def measure_import(module: str) -> dict:
+    """Импортировать модуль в чистом процессе, вернуть время и тяжёлые модули,
+    которые подгрузил именно этот импорт.
+
+    Модули, загруженные раньше (например, .pth-хуками site-packages при старте
+    интерпретатора), не учитываются — проверяется только сам импорт.
+    """
+    code = (
+        "import sys, time\n"
+        "before = set(sys.modules)\n"
+        "t = time.perf_counter()\n"
+        f"import {module}\n"
+        "elapsed = time.perf_counter() - t\n"
+        f"heavy = [m for m in {HEAVY_MODULES!r} if m in sys.modules and m not in before]\n"
+        "print(elapsed)\n"
+        "print(','.join(heavy))\n"
+    )
+    out = subprocess.run([sys.executable, "-c", code], cwd=LR_DIR,
+                         capture_output=True, text=True, check=True).stdout.splitlines()
+    # последние две строки — наши; выше может быть вывод самого модуля
+    return {"seconds": float(out[-2]), "heavy": [m for m in out[-1].split(",") if m]}
+
+
+def test_currency_service_import_is_lazy():
+    result = measure_import("currency_service")
+    print(f"import currency_service: {result['seconds'] * 1000:.1f} мс")
+    assert result["heavy"] == []
+    assert result["seconds"] < 1.0
+
+
+def test_app_import_is_lazy():
+    pytest.importorskip("fastapi")
+    result = measure_import("app")
+    print(f"import app: {result['seconds'] * 1000:.1f} мс")
+    assert result["heavy"] == []
+
+
+def test_settings_from_env():
+    settings = Settings.from_env({
+        "CURRENCY_UPDATE_INTERVAL": "30",
+        "CURRENCY_OBSERVERS": "logger, websocket",
+        "CURRENCY_CONSOLE_CURRENCIES": "USD,EUR",
+    })
+    assert settings.update_interval == 30
+    assert settings.observers == ["logger", "websocket"]
+    assert settings.console_currencies == ["USD", "EUR"]
+
+    with pytest.raises(ValueError):
+        Settings.from_env({"CURRENCY_OBSERVERS": "telegram"})
+
+
+def test_stop_monitoring_logs(capsys):
+    from currency_service import CurrencyService
+
+    service = CurrencyService()
+    service.is_running = True
+    service.stop_monitoring()
+    assert service.is_running is False
+    assert "остановлен" in capsys.readouterr().out